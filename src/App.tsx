@@ -20,6 +20,13 @@ import useViewportSize from './hooks/useViewportSize';
 
 const FINAL_LEVEL_INDEX = levels.length - 1;
 
+const KEY_DIRECTIONS = new Map<string, Direction>([
+  ['ArrowUp', 'up'],
+  ['ArrowDown', 'down'],
+  ['ArrowLeft', 'left'],
+  ['ArrowRight', 'right']
+]);
+
 type LevelOutcome = {
   levelIndex: number;
   status: 'won' | 'lost';
@@ -176,24 +183,11 @@ function Heatseeker() {
     const handleKeyPress = (event: KeyboardEvent): void => {
       if (!gameStarted) return;
 
-      switch (event.key) {
-        case 'ArrowUp':
-          event.preventDefault();
-          movePlayer('up');
-          break;
-        case 'ArrowDown':
-          event.preventDefault();
-          movePlayer('down');
-          break;
-        case 'ArrowLeft':
-          event.preventDefault();
-          movePlayer('left');
-          break;
-        case 'ArrowRight':
-          event.preventDefault();
-          movePlayer('right');
-          break;
-      }
+      const direction = KEY_DIRECTIONS.get(event.key);
+      if (!direction) return;
+
+      event.preventDefault();
+      movePlayer(direction);
     };
 
     window.addEventListener('keydown', handleKeyPress);
@@ -212,8 +206,8 @@ function Heatseeker() {
     setStartingGame(true);
     try {
       if (isLeaderboardConfigured) {
-        await startNewSession();
-        await refreshLeaderboard();
+        // Independent round-trips; run them concurrently so start latency is the slower of the two
+        await Promise.all([startNewSession(), refreshLeaderboard()]);
       }
 
       setCurrentLevel(0);
@@ -401,6 +395,14 @@ function Heatseeker() {
     return style;
   }, [cellSize, gridMaxHeight, gridMaxWidth, gridWidth, isCompactMobile, isSmallScreen, level.size]);
 
+  // Shared by every cell; rebuilding it per cell allocated up to 10k identical objects per render
+  const cellStyle = useMemo<CSSProperties>(() => ({
+    width: `${cellSize}px`,
+    height: `${cellSize}px`,
+    minWidth: '2px',
+    minHeight: '2px'
+  }), [cellSize]);
+
   if (!gameStarted) {
     return (
       <div className="flex min-h-screen flex-col items-center justify-center bg-gray-900 text-white lg:p-8">
@@ -474,12 +476,7 @@ function Heatseeker() {
               <div
                 key={`${x}-${y}`}
                 className={`${squareColor} ${isPlayer ? 'ring-2 ring-blue-400 ring-inset' : ''} border border-gray-700`}
-                style={{
-                  width: `${cellSize}px`,
-                  height: `${cellSize}px`,
-                  minWidth: '2px',
-                  minHeight: '2px'
-                }}
+                style={cellStyle}
               />
             );
           })
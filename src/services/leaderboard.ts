@@ -37,6 +37,9 @@ const AUTH_HEADERS: HeadersInit = SUPABASE_ANON_KEY
     }
   : {};
 
+// Merged once at load; every request shares this object unless it adds headers
+const BASE_HEADERS: HeadersInit = { ...DEFAULT_HEADERS, ...AUTH_HEADERS };
+
 export const isLeaderboardConfigured = Boolean(SUPABASE_URL && SUPABASE_ANON_KEY);
 
 const buildFunctionUrl = (functionName: string): string | null => {
@@ -124,11 +127,7 @@ async function callSupabaseFunction<T>(
     const response = await fetch(url, {
       method: 'POST',
       ...init,
-      headers: {
-        ...DEFAULT_HEADERS,
-        ...AUTH_HEADERS,
-        ...(init?.headers ?? {})
-      },
+      headers: init?.headers ? { ...BASE_HEADERS, ...init.headers } : BASE_HEADERS,
       body: payload ? JSON.stringify(payload) : undefined
     });
 
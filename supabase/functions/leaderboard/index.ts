@@ -7,6 +7,10 @@ const corsHeaders = {
   "Access-Control-Allow-Methods": "GET, OPTIONS"
 };
 
+const jsonHeaders = { "Content-Type": "application/json", ...corsHeaders };
+
+const LEADERBOARD_COLUMNS = "session_id, player_name, is_human, level_reached, total_moves, updated_at";
+
 const getEnv = (key: string): string => {
   const value = Deno.env.get(key);
   if (!value) {
@@ -31,7 +35,7 @@ serve(async (request) => {
 
   const { data, error } = await supabase
     .from("game_sessions")
-    .select("session_id, player_name, is_human, level_reached, total_moves, updated_at")
+    .select(LEADERBOARD_COLUMNS)
     .not("player_name", "is", null)
     .neq("player_name", "")
     .order("level_reached", { ascending: false })
@@ -43,12 +47,12 @@ serve(async (request) => {
     console.error("leaderboard fetch failed", error);
     return new Response(
       JSON.stringify({ error: "Unable to load leaderboard" }),
-      { status: 500, headers: { "Content-Type": "application/json", ...corsHeaders } }
+      { status: 500, headers: jsonHeaders }
     );
   }
 
   return new Response(
     JSON.stringify(data ?? []),
-    { status: 200, headers: { "Content-Type": "application/json", ...corsHeaders } }
+    { status: 200, headers: jsonHeaders }
   );
 });
@@ -7,6 +7,8 @@ const corsHeaders = {
   "Access-Control-Allow-Methods": "POST, OPTIONS"
 };
 
+const jsonHeaders = { "Content-Type": "application/json", ...corsHeaders };
+
 type StartSessionPayload = {
   userAgent?: string | null;
 };
@@ -70,12 +72,12 @@ serve(async (request) => {
     console.error("start-session insert failed", error);
     return new Response(
       JSON.stringify({ error: "Unable to create session" }),
-      { status: 500, headers: { "Content-Type": "application/json", ...corsHeaders } }
+      { status: 500, headers: jsonHeaders }
     );
   }
 
   return new Response(
     JSON.stringify({ sessionId: data.session_id }),
-    { status: 200, headers: { "Content-Type": "application/json", ...corsHeaders } }
+    { status: 200, headers: jsonHeaders }
   );
 });
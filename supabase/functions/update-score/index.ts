@@ -37,6 +37,10 @@ const corsHeaders = {
   "Access-Control-Allow-Methods": "POST, OPTIONS"
 };
 
+const jsonHeaders = { "Content-Type": "application/json", ...corsHeaders };
+
+const LEADERBOARD_COLUMNS = "session_id, player_name, is_human, level_reached, total_moves, updated_at";
+
 const sanitizeName = (name: string | null | undefined): string | null => {
   if (!name) return null;
   const trimmed = name.trim();
@@ -47,7 +51,7 @@ const sanitizeName = (name: string | null | undefined): string | null => {
 const collectLeaderboard = async (): Promise<LeaderboardRow[]> => {
   const { data, error } = await supabase
     .from<LeaderboardRow>("game_sessions")
-    .select("session_id, player_name, is_human, level_reached, total_moves, updated_at")
+    .select(LEADERBOARD_COLUMNS)
     .not("player_name", "is", null)
     .neq("player_name", "")
     .order("level_reached", { ascending: false })
@@ -77,7 +81,7 @@ serve(async (request) => {
   } catch (_error) {
     return new Response(
       JSON.stringify({ error: "Invalid JSON payload" }),
-      { status: 400, headers: { "Content-Type": "application/json", ...corsHeaders } }
+      { status: 400, headers: jsonHeaders }
     );
   }
 
@@ -88,14 +92,14 @@ serve(async (request) => {
   if (!sessionId) {
     return new Response(
       JSON.stringify({ error: "sessionId is required" }),
-      { status: 400, headers: { "Content-Type": "application/json", ...corsHeaders } }
+      { status: 400, headers: jsonHeaders }
     );
   }
 
   if (typeof levelReached !== "number" || typeof totalMoves !== "number") {
     return new Response(
       JSON.stringify({ error: "levelReached and totalMoves must be numbers" }),
-      { status: 400, headers: { "Content-Type": "application/json", ...corsHeaders } }
+      { status: 400, headers: jsonHeaders }
     );
   }
 
@@ -104,7 +108,7 @@ serve(async (request) => {
 
   const { data: sessionRow, error: fetchError } = await supabase
     .from("game_sessions")
-    .select("session_id, player_name, is_human, level_reached, total_moves, updated_at")
+    .select(LEADERBOARD_COLUMNS)
     .eq("session_id", sessionId)
     .single();
 
@@ -112,7 +116,7 @@ serve(async (request) => {
     console.error("update-score missing session", fetchError);
     return new Response(
       JSON.stringify({ error: "Session not found" }),
-      { status: 404, headers: { "Content-Type": "application/json", ...corsHeaders } }
+      { status: 404, headers: jsonHeaders }
     );
   }
 
@@ -127,13 +131,13 @@ serve(async (request) => {
     .from("game_sessions")
     .update(updates)
     .eq("session_id", sessionId)
-    .select("session_id, player_name, is_human, level_reached, total_moves, updated_at");
+    .select(LEADERBOARD_COLUMNS);
 
   if (updateError) {
     console.error("update-score update failed", updateError);
     return new Response(
       JSON.stringify({ error: "Unable to update session" }),
-      { status: 500, headers: { "Content-Type": "application/json", ...corsHeaders } }
+      { status: 500, headers: jsonHeaders }
     );
   }
 
@@ -151,6 +155,6 @@ serve(async (request) => {
       leaderboard,
       session: sessionEntry
     }),
-    { status: 200, headers: { "Content-Type": "application/json", ...corsHeaders } }
+    { status: 200, headers: jsonHeaders }
   );
 });